@@ -248,6 +248,9 @@ def parse_args(cmd_args=None, namespace=None):
     add_additional_option_to_group(pipeline_args_group, "--use_ecclib",
                                    help="use eccLib for faster GTF/FASTA parsing (requires eccLib to be installed)",
                                    action='store_true', default=False)
+    add_additional_option_to_group(pipeline_args_group, "--mmap_reference",
+                                   help="access reference genome via memory-mapped file (ignored with --use_ecclib)",
+                                   action='store_true', default=False)
 
     # OUTPUT SETUP
     output_setup_args_group.add_argument('--check_canonical', action='store_true', default=False,
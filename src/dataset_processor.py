@@ -91,10 +91,12 @@ class DatasetProcessor:
         if self.args.needs_reference:
             logger.info("Loading reference genome from %s" % self.args.reference)
             use_ecclib = getattr(self.args, 'use_ecclib', False)
+            use_mmap = getattr(self.args, 'mmap_reference', False)
             self.reference_record_dict = create_fasta_reader(
                 self.args.reference,
                 index_path=args.fai_file_name,
-                use_ecclib=use_ecclib
+                use_ecclib=use_ecclib,
+                use_mmap=use_mmap
             )
         else:
             self.reference_record_dict = None
@@ -9,8 +9,8 @@
 Abstraction layer for file parsing in IsoQuant.
 
 This module provides unified interfaces for GTF and FASTA file parsing,
-with support for both traditional backends (gffutils, pyfaidx) and the
-high-performance eccLib library.
+with support for both traditional backends (gffutils, pyfaidx), a
+memory-mapped FASTA reader and the high-performance eccLib library.
 
 The eccLib library is optional and will be used when:
 1. It is installed
@@ -22,8 +22,11 @@ the standard backends.
 """
 
 import logging
+import mmap
 import os
-from abc import ABC, abstractmethod
+import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger('IsoQuant')
 
@@ -34,32 +37,38 @@ ECCLIB_WORKING = False
 try:
     import eccLib
     ECCLIB_AVAILABLE = True
-    # Test if eccLib actually works on this platform
-    # Some platforms may have the library but it may crash
-    try:
-        # Quick sanity check - just ensure the module has expected functions
-        if hasattr(eccLib, 'parseFASTA') and hasattr(eccLib, 'parseGTF'):
-            ECCLIB_WORKING = True
-    except Exception:
-        ECCLIB_WORKING = False
+    # Some platforms may have the library but it may crash,
+    # quick sanity check - just ensure the module has expected functions
+    ECCLIB_WORKING = all(hasattr(eccLib, name) for name in ('parseFASTA', 'parseGTF'))
 except ImportError:
     pass
 
+_ECCLIB_READY = ECCLIB_AVAILABLE and ECCLIB_WORKING
+
 
 def is_ecclib_available():
     """Check if eccLib is available and appears to be working."""
-    return ECCLIB_AVAILABLE and ECCLIB_WORKING
+    return _ECCLIB_READY
+
 
+def _advise_file(fd: int, advice_name: str) -> None:
+    """Pass an access pattern hint to the kernel, silently ignored where unsupported."""
+    advice = getattr(os, advice_name, None)
+    if advice is None or not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, advice)
+    except OSError:
+        pass
 
-class FASTAReaderInterface(ABC):
-    """Abstract interface for FASTA file access."""
 
-    @abstractmethod
+class FASTAReaderInterface:
+    """Base interface for FASTA file access, subclasses implement all methods."""
+
     def load(self, fasta_path: str, index_path: str = None) -> None:
         """Load a FASTA file."""
-        pass
+        raise NotImplementedError()
 
-    @abstractmethod
     def get_sequence(self, chr_id: str, start: int = None, end: int = None) -> str:
         """
         Get sequence for a chromosome or region.
@@ -72,9 +81,31 @@ class FASTAReaderInterface(ABC):
         Returns:
             Sequence string
         """
-        pass
+        raise NotImplementedError()
+
+    def get_sequences(self, chr_id: str, intervals: list) -> list:
+        """
+        Get sequences for several regions of the same chromosome.
+
+        Args:
+            chr_id: Chromosome/contig identifier
+            intervals: List of (start, end) pairs (0-based, end exclusive)
+
+        Returns:
+            List of sequence strings, one per interval
+        """
+        raise NotImplementedError()
+
+    def get_sequence_view(self, chr_id: str, start: int = None, end: int = None) -> memoryview:
+        """
+        Get read-only ASCII bytes view of a region, for consumers that do not need str
+        (e.g. length or hash computation).
+
+        Backends that keep sequences in memory return a view without copying,
+        such view is valid only while the reader and its cached sequence live.
+        """
+        return memoryview(self.get_sequence(chr_id, start, end).encode('ascii'))
 
-    @abstractmethod
     def get_chromosome_record(self, chr_id: str):
         """
         Get the chromosome record object for direct access.
@@ -82,22 +113,19 @@ class FASTAReaderInterface(ABC):
         This is needed for compatibility with existing IsoQuant code
         that accesses chromosome records directly.
         """
-        pass
+        raise NotImplementedError()
 
-    @abstractmethod
     def get_chromosome_ids(self) -> list:
         """Get list of all chromosome/contig IDs."""
-        pass
+        raise NotImplementedError()
 
-    @abstractmethod
     def get_chromosome_length(self, chr_id: str) -> int:
         """Get the length of a chromosome."""
-        pass
+        raise NotImplementedError()
 
-    @abstractmethod
     def keys(self):
         """Return chromosome IDs (dict-like interface)."""
-        pass
+        raise NotImplementedError()
 
     def __getitem__(self, chr_id: str):
         """Allow dict-like access: reader[chr_id]."""
@@ -105,33 +133,56 @@ class FASTAReaderInterface(ABC):
 
 
 class PyfaidxReader(FASTAReaderInterface):
-    """FASTA reader using pyfaidx (default backend)."""
+    """
+    FASTA reader using pyfaidx (default backend).
 
-    def __init__(self):
+    By default pyfaidx is opened in raw mode, so slicing returns plain
+    strings instead of Sequence objects. Set as_raw=False to get the
+    previous behaviour.
+    """
+
+    def __init__(self, as_raw: bool = True):
         from pyfaidx import Fasta
         self._Fasta = Fasta
         self.fasta = None
+        self.as_raw = as_raw
 
     def load(self, fasta_path: str, index_path: str = None) -> None:
         """Load FASTA file using pyfaidx."""
+        kwargs = {}
         if index_path:
-            self.fasta = self._Fasta(fasta_path, indexname=index_path)
-        else:
-            self.fasta = self._Fasta(fasta_path)
+            kwargs['indexname'] = index_path
+        if self.as_raw:
+            kwargs['as_raw'] = True
+            kwargs['sequence_always_upper'] = False
+        self.fasta = self._Fasta(fasta_path, **kwargs)
+        # regions are mostly fetched in coordinate order, enable larger readahead on pyfaidx's own handle
+        try:
+            _advise_file(self.fasta.faidx.file.fileno(), 'POSIX_FADV_SEQUENTIAL')
+        except (AttributeError, OSError, ValueError):
+            pass
 
     def get_sequence(self, chr_id: str, start: int = None, end: int = None) -> str:
         """Get sequence for a region."""
-        if start is None and end is None:
-            return str(self.fasta[chr_id][:])
-        elif start is not None and end is not None:
-            return str(self.fasta[chr_id][start:end])
-        elif start is not None:
-            return str(self.fasta[chr_id][start:])
-        else:
-            return str(self.fasta[chr_id][:end])
+        # None bounds are handled by slicing itself
+        seq = self.fasta[chr_id][start:end]
+        # in raw mode pyfaidx already returns str
+        return seq if self.as_raw else str(seq)
+
+    def get_sequences(self, chr_id: str, intervals: list) -> list:
+        """Get sequences for several regions of one chromosome."""
+        record = self.fasta[chr_id]
+        if self.as_raw:
+            return [record[start:end] for start, end in intervals]
+        return [str(record[start:end]) for start, end in intervals]
 
     def get_chromosome_record(self, chr_id: str):
-        """Get pyfaidx chromosome record for direct access."""
+        """
+        Get pyfaidx chromosome record for direct access.
+
+        In raw mode slicing the record returns str, so str() calls
+        made by the downstream code are no-ops.
+        """
         return self.fasta[chr_id]
 
     def get_chromosome_ids(self) -> list:
@@ -153,13 +204,26 @@ class EccLibFASTAReader(FASTAReaderInterface):
 
     Note: eccLib has different API than pyfaidx, so this adapter
     provides compatibility with the IsoQuant codebase.
+
+    Chromosome sequences are materialized lazily and only the
+    max_cached most recently used ones are kept in the reader cache.
+    Note that an indexed EccLibChromosomeRecord keeps its chromosome alive
+    on its own, so while records exist memory is bounded by max_cached
+    plus the chromosomes of live records.
+    With prefetch=True all chromosomes are materialized in parallel
+    during load and are never evicted.
     """
 
-    def __init__(self):
+    def __init__(self, max_cached: int = 4, prefetch: bool = False, prefetch_threads: int = None):
         import eccLib
         self._ecclib = eccLib
         self.fasta_data = None
-        self._sequence_cache = {}
+        self._sequence_cache = OrderedDict()
+        self._max_cached = max(1, max_cached)
+        self._prefetch = prefetch
+        self._prefetch_threads = prefetch_threads or min(8, os.cpu_count() or 1)
+        self._lengths = {}
+        self._chr_ids_list = []
 
     def load(self, fasta_path: str, index_path: str = None) -> None:
         """
@@ -168,30 +232,83 @@ class EccLibFASTAReader(FASTAReaderInterface):
         Note: eccLib doesn't use index files - it parses the full file.
         The index_path parameter is accepted for API compatibility but ignored.
         """
+        # eccLib reads the whole file, start populating page cache in advance
+        try:
+            fd = os.open(fasta_path, os.O_RDONLY)
+            try:
+                _advise_file(fd, 'POSIX_FADV_WILLNEED')
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
         try:
             self.fasta_data = self._ecclib.parseFASTA(fasta_path)
-            # Pre-cache sequences as strings for faster access
-            for chr_id in self.fasta_data.keys():
-                self._sequence_cache[chr_id] = self.fasta_data[chr_id].dump()
         except Exception as e:
             logger.warning(f"eccLib FASTA parsing failed: {e}")
             raise
+        self._sequence_cache.clear()
+        self._chr_ids_list = [sys.intern(chr_id) for chr_id in self.fasta_data.keys()]
+        self._lengths = {}
+        try:
+            for chr_id in self._chr_ids_list:
+                self._lengths[chr_id] = len(self.fasta_data[chr_id])
+        except TypeError:
+            # records do not support len(), lengths are computed on demand
+            self._lengths = {}
+        if self._prefetch:
+            self._prefetch_all()
+
+    def _prefetch_all(self) -> None:
+        """Materialize all chromosomes using a thread pool."""
+        with ThreadPoolExecutor(max_workers=self._prefetch_threads) as executor:
+            futures = {chr_id: executor.submit(self._dump, chr_id) for chr_id in self._chr_ids_list}
+            for chr_id, future in futures.items():
+                self._sequence_cache[chr_id] = future.result()
+
+    def _dump(self, chr_id: str) -> bytes:
+        record = self.fasta_data[chr_id]
+        dump_bytes = getattr(record, 'dump_bytes', None)
+        if dump_bytes is not None:
+            # avoid creating an intermediate str of the whole chromosome
+            return bytes(dump_bytes())
+        seq = record.dump()
+        if isinstance(seq, str):
+            seq = seq.encode('ascii')
+        return seq
+
+    def _get_full(self, chr_id: str) -> bytes:
+        """Get full chromosome sequence as ASCII bytes, using bounded LRU cache."""
+        seq = self._sequence_cache.get(chr_id)
+        if seq is not None:
+            self._sequence_cache.move_to_end(chr_id)
+            return seq
+
+        seq = self._dump(chr_id)
+        chr_id = sys.intern(chr_id)
+        self._sequence_cache[chr_id] = seq
+        self._lengths[chr_id] = len(seq)
+        if not self._prefetch and len(self._sequence_cache) > self._max_cached:
+            self._sequence_cache.popitem(last=False)
+        return seq
 
     def get_sequence(self, chr_id: str, start: int = None, end: int = None) -> str:
-        """Get sequence for a region."""
-        seq = self._sequence_cache.get(chr_id)
-        if seq is None:
-            seq = self.fasta_data[chr_id].dump()
-            self._sequence_cache[chr_id] = seq
+        """
+        Get sequence for a region.
 
-        if start is None and end is None:
-            return seq
-        elif start is not None and end is not None:
-            return seq[start:end]
-        elif start is not None:
-            return seq[start:]
-        else:
-            return seq[:end]
+        The region is cut from the cached bytes via memoryview, so the only
+        copy made is the final decode into str. None bounds are handled
+        by slicing itself.
+        """
+        return str(memoryview(self._get_full(chr_id))[start:end], 'ascii')
+
+    def get_sequence_view(self, chr_id: str, start: int = None, end: int = None) -> memoryview:
+        """Get zero-copy view of a region in the cached chromosome bytes."""
+        return memoryview(self._get_full(chr_id))[start:end]
+
+    def get_sequences(self, chr_id: str, intervals: list) -> list:
+        """Get sequences for several regions of one chromosome."""
+        view = memoryview(self._get_full(chr_id))
+        return [str(view[start:end], 'ascii') for start, end in intervals]
 
     def get_chromosome_record(self, chr_id: str):
         """
@@ -200,19 +317,19 @@ class EccLibFASTAReader(FASTAReaderInterface):
         Returns an EccLibChromosomeRecord wrapper that provides
         pyfaidx-like slicing interface.
         """
-        return EccLibChromosomeRecord(self, chr_id)
+        return EccLibChromosomeRecord(self, sys.intern(chr_id))
 
     def get_chromosome_ids(self) -> list:
         """Get list of chromosome IDs."""
-        return list(self.fasta_data.keys())
+        return list(self._chr_ids_list)
 
     def get_chromosome_length(self, chr_id: str) -> int:
-        """Get chromosome length."""
-        seq = self._sequence_cache.get(chr_id)
-        if seq is None:
-            seq = self.fasta_data[chr_id].dump()
-            self._sequence_cache[chr_id] = seq
-        return len(seq)
+        """Get chromosome length without materializing the sequence when possible."""
+        length = self._lengths.get(chr_id)
+        if length is None:
+            # the length is stored by _get_full when a chromosome is dumped
+            length = len(self._get_full(chr_id))
+        return length
 
     def keys(self):
         """Return chromosome IDs."""
@@ -225,19 +342,211 @@ class EccLibChromosomeRecord:
     for eccLib parsed data.
 
     This allows code like `chr_record[start:end]` to work with eccLib.
+    Slices are returned as _Slice views over the cached chromosome bytes.
+
+    The chromosome is materialized on first indexing, after that the record
+    keeps a view of its sequence, which stays alive even if the reader
+    evicts it from the cache.
     """
 
+    __slots__ = ('_reader', '_chr_id', '_view')
+
     def __init__(self, reader: EccLibFASTAReader, chr_id: str):
         self._reader = reader
         self._chr_id = chr_id
+        self._view = None
+
+    def __getitem__(self, key):
+        """Support slicing: record[start:end]."""
+        view = self._view
+        if view is None:
+            view = self._view = memoryview(self._reader._get_full(self._chr_id))
+        if isinstance(key, slice):
+            return _Slice(view[key])
+        # memoryview raises IndexError / TypeError for invalid keys
+        return chr(view[key])
+
+    def __len__(self):
+        """Return chromosome length."""
+        return self._reader.get_chromosome_length(self._chr_id)
+
+    def __str__(self):
+        """Return full sequence as string."""
+        view = self._view
+        if view is None:
+            view = self._view = memoryview(self._reader._get_full(self._chr_id))
+        # decode the kept view, the reader may have evicted this chromosome already
+        return str(view, 'ascii')
+
+
+class _Slice:
+    """
+    Read-only sequence region backed either by str or by a memoryview
+    over ASCII bytes.
+
+    Mimics pyfaidx Sequence: str() returns str data as is and decodes
+    bytes lazily, len() and indexing do not create a string copy.
+    """
+
+    __slots__ = ('_data',)
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return _Slice(self._data[key])
+        base = self._data[key]
+        return base if isinstance(base, str) else chr(base)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __str__(self):
+        data = self._data
+        if isinstance(data, str):
+            return data
+        if not data.contiguous:
+            # stepped slice, e.g. record[::-1]
+            return data.tobytes().decode('ascii')
+        return str(data, 'ascii')
+
+    def __repr__(self):
+        return f"_Slice({str(self)!r})"
+
+    def __eq__(self, other):
+        if isinstance(other, _Slice):
+            return str(self) == str(other)
+        if isinstance(other, str):
+            return str(self) == other
+        return NotImplemented
+
+    __hash__ = None
+
+
+def strip_newlines(data: bytes, eol_length: int = 1) -> bytes:
+    """
+    Remove line terminators from raw FASTA bytes.
+
+    Args:
+        data: Raw FASTA bytes
+        eol_length: Line terminator length, 1 for LF and 2 for CRLF files
+
+    Returns:
+        Sequence bytes without line terminators
+    """
+    if eol_length == 1:
+        # memchr-based search, several times faster than translate
+        return data.replace(b'\n', b'')
+    return data.translate(None, b'\r\n')
+
+
+class MmapFaidxReader(FASTAReaderInterface):
+    """
+    FASTA reader that memory-maps the FASTA file and uses the .fai index
+    to translate regions into byte offsets.
+
+    Slicing does not issue any system calls, pages are cached by the kernel.
+    The index is read, created or rebuilt when stale via pyfaidx.
+    """
+
+    def __init__(self):
+        self._mmap = None
+        self._view = None
+        # chr_id -> (offset, length, linebases, linewidth)
+        self._index = {}
+
+    def load(self, fasta_path: str, index_path: str = None) -> None:
+        """Memory-map FASTA file and read its index."""
+        from pyfaidx import Faidx
+        # Faidx creates the index if it is missing or older than the FASTA file
+        faidx = Faidx(fasta_path, indexname=index_path) if index_path else Faidx(fasta_path)
+        try:
+            self._index = {chr_id: (record.offset, record.rlen, record.lenc, record.lenb)
+                           for chr_id, record in faidx.index.items()}
+        finally:
+            faidx.close()
+
+        with open(fasta_path, 'rb') as fasta_file:
+            self._mmap = mmap.mmap(fasta_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+
+    def _get_bytes(self, index_entry: tuple, start: int = None, end: int = None):
+        """Return region as bytes, or as a view into the mapped file when it has no line breaks."""
+        offset, length, linebases, linewidth = index_entry
+        start, end, _ = slice(start, end).indices(length)
+        if start >= end:
+            return b''
+        byte_start = offset + start // linebases * linewidth + start % linebases
+        byte_end = offset + end // linebases * linewidth + end % linebases
+        data = self._view[byte_start:byte_end]
+        if len(data) == end - start:
+            # region lies within a single line
+            return data
+        return strip_newlines(bytes(data), linewidth - linebases)
+
+    def get_sequence(self, chr_id: str, start: int = None, end: int = None) -> str:
+        """Get sequence for a region."""
+        return str(self._get_bytes(self._index[chr_id], start, end), 'ascii')
+
+    def get_sequence_view(self, chr_id: str, start: int = None, end: int = None) -> memoryview:
+        """Get view of a region, zero-copy when the region lies within a single line."""
+        return memoryview(self._get_bytes(self._index[chr_id], start, end))
+
+    def get_sequences(self, chr_id: str, intervals: list) -> list:
+        """Get sequences for several regions of one chromosome."""
+        index_entry = self._index[chr_id]
+        return [str(self._get_bytes(index_entry, start, end), 'ascii') for start, end in intervals]
+
+    def get_chromosome_record(self, chr_id: str):
+        """
+        Get chromosome record for direct access.
+
+        Returns a MmapChromosomeRecord wrapper that provides
+        pyfaidx-like slicing interface.
+        """
+        if chr_id not in self._index:
+            raise KeyError(chr_id)
+        return MmapChromosomeRecord(self, chr_id)
+
+    def get_chromosome_ids(self) -> list:
+        """Get list of chromosome IDs."""
+        return list(self._index.keys())
+
+    def get_chromosome_length(self, chr_id: str) -> int:
+        """Get chromosome length."""
+        return self._index[chr_id][1]
+
+    def keys(self):
+        """Return chromosome IDs."""
+        return self._index.keys()
+
+
+class MmapChromosomeRecord:
+    """
+    Wrapper class to provide pyfaidx-like chromosome record interface
+    for memory-mapped FASTA files.
+    """
+
+    __slots__ = ('_reader', '_chr_id')
+
+    def __init__(self, reader: MmapFaidxReader, chr_id: str):
+        self._reader = reader
+        self._chr_id = chr_id
 
     def __getitem__(self, key):
         """Support slicing: record[start:end]."""
         if isinstance(key, slice):
+            if key.step not in (None, 1):
+                raise ValueError("slice step is not supported")
             return self._reader.get_sequence(self._chr_id, key.start, key.stop)
         elif isinstance(key, int):
-            seq = self._reader.get_sequence(self._chr_id)
-            return seq[key]
+            length = len(self)
+            if key < 0:
+                key += length
+            if not 0 <= key < length:
+                raise IndexError("sequence index out of range")
+            return self._reader.get_sequence(self._chr_id, key, key + 1)
         else:
             raise TypeError(f"indices must be integers or slices, not {type(key).__name__}")
 
@@ -251,12 +560,13 @@ class EccLibChromosomeRecord:
 
 
 # Factory function
-def get_fasta_reader(use_ecclib: bool = False) -> FASTAReaderInterface:
+def get_fasta_reader(use_ecclib: bool = False, use_mmap: bool = False) -> FASTAReaderInterface:
     """
     Get appropriate FASTA reader based on configuration.
 
     Args:
         use_ecclib: If True, try to use eccLib (falls back if unavailable)
+        use_mmap: If True, use memory-mapped FASTA access (ignored if eccLib is used)
 
     Returns:
         FASTAReaderInterface implementation
@@ -272,22 +582,27 @@ def get_fasta_reader(use_ecclib: bool = False) -> FASTAReaderInterface:
             else:
                 logger.warning("eccLib requested but not installed, falling back to pyfaidx")
 
+    if use_mmap:
+        logger.info("Using memory-mapped FASTA access")
+        return MmapFaidxReader()
+
     return PyfaidxReader()
 
 
 def create_fasta_reader(fasta_path: str, index_path: str = None,
-                        use_ecclib: bool = False) -> FASTAReaderInterface:
+                        use_ecclib: bool = False, use_mmap: bool = False) -> FASTAReaderInterface:
     """
     Convenience function to create and load a FASTA reader.
 
     Args:
         fasta_path: Path to FASTA file
-        index_path: Optional path to index file (for pyfaidx)
+        index_path: Optional path to index file (for pyfaidx and mmap reader)
         use_ecclib: If True, try to use eccLib
+        use_mmap: If True, use memory-mapped FASTA access
 
     Returns:
         Loaded FASTAReaderInterface
     """
-    reader = get_fasta_reader(use_ecclib)
+    reader = get_fasta_reader(use_ecclib, use_mmap)
     reader.load(fasta_path, index_path)
     return reader
@@ -0,0 +1,317 @@
+############################################################################
+# Copyright (c) 2022-2026 University of Helsinki
+# All Rights Reserved
+# See file LICENSE for details.
+############################################################################
+
+import gc
+import os
+import sys
+import weakref
+import types
+
+import pytest
+
+import src.file_parsers
+from src.file_parsers import PyfaidxReader, MmapFaidxReader, EccLibFASTAReader, create_fasta_reader, strip_newlines, _Slice
+
+
+CHR1 = "ACGTACGTAC" * 7 + "acgt"
+CHR2 = "TTTTGGGGCCCCAAAA" * 3
+
+
+def write_fasta(path, records, line_width=60, newline="\n"):
+    with open(path, "w", newline="") as outf:
+        for chr_id, seq in records:
+            outf.write(">%s%s" % (chr_id, newline))
+            for i in range(0, len(seq), line_width):
+                outf.write(seq[i:i + line_width] + newline)
+
+
+@pytest.fixture
+def fasta_path(tmp_path):
+    path = str(tmp_path / "ref.fa")
+    write_fasta(path, [("chr1", CHR1), ("chr2", CHR2)], line_width=13)
+    return path
+
+
+class TestPyfaidxReader:
+    """Test pyfaidx-based FASTA reader."""
+
+    @pytest.mark.parametrize("as_raw", [True, False])
+    def test_get_sequence(self, fasta_path, as_raw):
+        reader = PyfaidxReader(as_raw=as_raw)
+        reader.load(fasta_path)
+        assert reader.get_sequence("chr1") == CHR1
+        assert reader.get_sequence("chr1", 5, 40) == CHR1[5:40]
+        assert reader.get_sequence("chr1", 70) == CHR1[70:]
+        assert reader.get_sequence("chr2", end=17) == CHR2[:17]
+        assert isinstance(reader.get_sequence("chr2", 1, 3), str)
+        assert reader.get_sequence_view("chr1", 5, 40) == CHR1[5:40].encode("ascii")
+        assert reader.get_sequences("chr1", [(0, 5), (13, 30), (70, 74)]) == [CHR1[0:5], CHR1[13:30], CHR1[70:74]]
+
+    def test_chromosome_record(self, fasta_path):
+        reader = create_fasta_reader(fasta_path, index_path=fasta_path + ".fai")
+        assert os.path.exists(fasta_path + ".fai")
+        record = reader["chr1"]
+        assert record[3:29] == CHR1[3:29]
+        assert str(record[3:29]) == CHR1[3:29]
+        assert record[12] == CHR1[12]
+        assert len(record) == len(CHR1)
+        assert str(record) == CHR1
+
+    def test_reader_freed(self, fasta_path):
+        gc.disable()
+        try:
+            reader = create_fasta_reader(fasta_path)
+            reader_ref = weakref.ref(reader)
+            del reader
+            assert reader_ref() is None
+        finally:
+            gc.enable()
+
+    def test_chromosome_info(self, fasta_path):
+        reader = create_fasta_reader(fasta_path)
+        assert reader.get_chromosome_ids() == ["chr1", "chr2"]
+        assert list(reader.keys()) == ["chr1", "chr2"]
+        assert reader.get_chromosome_length("chr2") == len(CHR2)
+
+
+class TestMmapFaidxReader:
+    """Test memory-mapped FASTA reader."""
+
+    @pytest.mark.parametrize("newline", ["\n", "\r\n"])
+    def test_all_regions(self, tmp_path, newline):
+        path = str(tmp_path / "ref.fa")
+        write_fasta(path, [("chr1", CHR1), ("chr2", CHR2)], line_width=13, newline=newline)
+        reader = create_fasta_reader(path, use_mmap=True)
+        assert isinstance(reader, MmapFaidxReader)
+        for chr_id, seq in [("chr1", CHR1), ("chr2", CHR2)]:
+            for start in range(len(seq) + 1):
+                for end in range(start, len(seq) + 2):
+                    assert reader.get_sequence(chr_id, start, end) == seq[start:end]
+                    assert reader.get_sequence_view(chr_id, start, end) == seq[start:end].encode("ascii")
+
+    def test_get_sequence(self, fasta_path):
+        reader = MmapFaidxReader()
+        reader.load(fasta_path)
+        assert os.path.exists(fasta_path + ".fai")
+        assert reader.get_sequence("chr1") == CHR1
+        assert reader.get_sequence("chr1", 70) == CHR1[70:]
+        assert reader.get_sequence("chr2", end=17) == CHR2[:17]
+        assert reader.get_sequence("chr2", -5) == CHR2[-5:]
+        assert reader.get_sequence("chr2", 20, 10) == ""
+        assert reader.get_sequences("chr1", [(0, 5), (13, 30), (70, 74)]) == [CHR1[0:5], CHR1[13:30], CHR1[70:74]]
+
+    def test_stale_index(self, fasta_path):
+        create_fasta_reader(fasta_path, use_mmap=True)
+        index_time = os.path.getmtime(fasta_path + ".fai")
+        write_fasta(fasta_path, [("chr_renamed", CHR2)], line_width=7)
+        os.utime(fasta_path, (index_time + 10, index_time + 10))
+        reader = create_fasta_reader(fasta_path, use_mmap=True)
+        assert reader.get_chromosome_ids() == ["chr_renamed"]
+        assert reader.get_sequence("chr_renamed") == CHR2
+
+    def test_chromosome_record(self, fasta_path):
+        reader = create_fasta_reader(fasta_path, use_mmap=True)
+        record = reader["chr1"]
+        assert str(record[3:29]) == CHR1[3:29]
+        assert record[12] == CHR1[12]
+        assert record[-1] == CHR1[-1]
+        assert len(record) == len(CHR1)
+        assert str(record) == CHR1
+        with pytest.raises(IndexError):
+            record[len(CHR1)]
+        with pytest.raises(KeyError):
+            reader["chr3"]
+
+    def test_chromosome_info(self, fasta_path):
+        reader = create_fasta_reader(fasta_path, use_mmap=True)
+        assert reader.get_chromosome_ids() == ["chr1", "chr2"]
+        assert list(reader.keys()) == ["chr1", "chr2"]
+        assert reader.get_chromosome_length("chr2") == len(CHR2)
+
+
+def test_strip_newlines():
+    assert strip_newlines(b"ACG\nTTA\nC") == b"ACGTTAC"
+    assert strip_newlines(b"ACG\r\nTTA\r\nC", eol_length=2) == b"ACGTTAC"
+    assert strip_newlines(b"ACGT") == b"ACGT"
+
+
+class TestSlice:
+    """Test lazy sequence slice wrapper."""
+
+    def test_bytes_view(self):
+        data = CHR1.encode("ascii")
+        seq = _Slice(memoryview(data)[10:30])
+        assert len(seq) == 20
+        assert str(seq) == CHR1[10:30]
+        assert seq[3] == CHR1[13]
+        assert str(seq[2:5]) == CHR1[12:15]
+        assert seq == CHR1[10:30]
+        assert seq != CHR1[11:31]
+        assert str(seq[::2]) == CHR1[10:30:2]
+        assert str(seq[::-1]) == CHR1[10:30][::-1]
+
+    def test_str_data(self):
+        data = CHR1[10:30]
+        seq = _Slice(data)
+        assert str(seq) is data
+        assert seq[3] == CHR1[13]
+        assert str(seq[2:5]) == CHR1[12:15]
+        assert seq == _Slice(memoryview(CHR1.encode("ascii"))[10:30])
+
+
+class StubEccLibRecord:
+    """Minimal stand-in for an eccLib FASTA record."""
+
+    def __init__(self, seq):
+        self.seq = seq
+        self.dump_count = 0
+
+    def dump(self):
+        self.dump_count += 1
+        return self.seq
+
+    def __len__(self):
+        return len(self.seq)
+
+
+class StubEccLibRecordNoLen(StubEccLibRecord):
+    __len__ = None
+
+
+class StubEccLibRecordBytes(StubEccLibRecord):
+    def dump(self):
+        raise AssertionError("dump_bytes should be preferred")
+
+    def dump_bytes(self):
+        self.dump_count += 1
+        return self.seq.encode("ascii")
+
+
+def read_fasta_dict(path):
+    records = {}
+    chr_id = None
+    with open(path) as inf:
+        for line in inf:
+            line = line.strip()
+            if line.startswith(">"):
+                chr_id = line[1:]
+                records[chr_id] = []
+            elif line:
+                records[chr_id].append(line)
+    return {chr_id: "".join(lines) for chr_id, lines in records.items()}
+
+
+@pytest.fixture
+def ecclib_stub(monkeypatch):
+    """Install a stub eccLib module; returns a function to select record type."""
+    module = types.ModuleType("eccLib")
+    module.record_class = StubEccLibRecord
+
+    def parse_fasta(path):
+        return {chr_id: module.record_class(seq) for chr_id, seq in read_fasta_dict(path).items()}
+
+    module.parseFASTA = parse_fasta
+    module.parseGTF = lambda path: None
+    monkeypatch.setitem(sys.modules, "eccLib", module)
+    monkeypatch.setattr(src.file_parsers, "_ECCLIB_READY", True)
+
+    def set_record_class(record_class):
+        module.record_class = record_class
+    return set_record_class
+
+
+@pytest.mark.usefixtures("ecclib_stub")
+class TestEccLibFASTAReader:
+    """Test eccLib-based FASTA reader using a stub eccLib module."""
+
+    def test_get_sequence(self, fasta_path):
+        reader = create_fasta_reader(fasta_path, use_ecclib=True)
+        assert isinstance(reader, EccLibFASTAReader)
+        assert reader.get_sequence("chr1") == CHR1
+        assert reader.get_sequence("chr1", 5, 40) == CHR1[5:40]
+        assert reader.get_sequence("chr2", end=17) == CHR2[:17]
+        assert reader.get_chromosome_length("chr2") == len(CHR2)
+        assert reader.get_sequences("chr1", [(0, 5), (13, 30), (70, 74)]) == [CHR1[0:5], CHR1[13:30], CHR1[70:74]]
+        assert reader.get_sequence_view("chr1", 5, 40) == CHR1[5:40].encode("ascii")
+        chr_ids = reader.get_chromosome_ids()
+        chr_ids.append("chr3")
+        assert reader.get_chromosome_ids() == ["chr1", "chr2"]
+
+    def test_bounded_cache(self, fasta_path):
+        reader = EccLibFASTAReader(max_cached=1)
+        reader.load(fasta_path)
+        assert reader.get_sequence("chr1", 0, 4) == CHR1[:4]
+        assert reader.get_sequence("chr2", 0, 4) == CHR2[:4]
+        assert list(reader._sequence_cache.keys()) == ["chr2"]
+        assert reader.get_sequence("chr1", 0, 4) == CHR1[:4]
+        assert list(reader._sequence_cache.keys()) == ["chr1"]
+
+    def test_prefetch(self, fasta_path):
+        reader = EccLibFASTAReader(max_cached=1, prefetch=True, prefetch_threads=2)
+        reader.load(fasta_path)
+        assert sorted(reader._sequence_cache.keys()) == ["chr1", "chr2"]
+        assert reader.get_sequence("chr2", 3, 9) == CHR2[3:9]
+
+    def test_chromosome_record(self, fasta_path):
+        reader = create_fasta_reader(fasta_path, use_ecclib=True)
+        record = reader["chr1"]
+        assert str(record[3:29]) == CHR1[3:29]
+        assert record[12] == CHR1[12]
+        assert len(record) == len(CHR1)
+        assert str(record) == CHR1
+        assert record[-1] == CHR1[-1]
+        with pytest.raises(IndexError):
+            record[len(CHR1)]
+        assert str(record[::2]) == CHR1[::2]
+        assert str(record[::-1]) == CHR1[::-1]
+        assert str(record[20:3:-3]) == CHR1[20:3:-3]
+
+    def test_record_after_eviction(self, fasta_path):
+        reader = EccLibFASTAReader(max_cached=1)
+        reader.load(fasta_path)
+        record = reader["chr1"]
+        assert str(record[0:4]) == CHR1[:4]
+        assert reader.get_sequence("chr2", 0, 4) == CHR2[:4]
+        assert "chr1" not in reader._sequence_cache
+        assert str(record) == CHR1
+        assert str(record[5:9]) == CHR1[5:9]
+        assert reader.fasta_data["chr1"].dump_count == 1
+
+    def test_length_without_len(self, fasta_path, ecclib_stub):
+        ecclib_stub(StubEccLibRecordNoLen)
+        reader = EccLibFASTAReader(max_cached=1)
+        reader.load(fasta_path)
+        assert reader._lengths == {}
+        assert reader.get_chromosome_length("chr1") == len(CHR1)
+        assert reader.get_sequence("chr2", 0, 4) == CHR2[:4]
+        # chr1 is evicted, but its length is remembered
+        assert "chr1" not in reader._sequence_cache
+        assert reader.get_chromosome_length("chr1") == len(CHR1)
+        assert reader.fasta_data["chr1"].dump_count == 1
+
+    def test_length_without_dump(self, fasta_path):
+        reader = EccLibFASTAReader()
+        reader.load(fasta_path)
+        assert reader.get_chromosome_length("chr2") == len(CHR2)
+        assert reader.fasta_data["chr2"].dump_count == 0
+        assert reader._sequence_cache == {}
+
+    def test_dump_bytes(self, fasta_path, ecclib_stub):
+        ecclib_stub(StubEccLibRecordBytes)
+        reader = EccLibFASTAReader()
+        reader.load(fasta_path)
+        assert reader.get_sequence("chr1", 5, 40) == CHR1[5:40]
+        assert isinstance(reader._sequence_cache["chr1"], bytes)
+        assert reader.fasta_data["chr1"].dump_count == 1
+
+    def test_bytes_cache(self, fasta_path):
+        reader = EccLibFASTAReader()
+        reader.load(fasta_path)
+        reader.get_sequence("chr1", 0, 4)
+        assert reader._sequence_cache["chr1"] == CHR1.encode("ascii")
+        record = reader["chr1"]
+        assert isinstance(record[3:29], _Slice)
+        assert reader.fasta_data["chr1"].dump_count == 1